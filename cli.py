@@ -1,10 +1,18 @@
 import click
 from datetime import datetime
 from typing import List
-from database import db
 import sys
 import platform
-from utils import reminders
+
+TASK_TEMPLATE = """
+📌 {title} [ID: {id}]
+   Status: {status}
+   Priority: {priority}
+   Due: {due_date}
+   Created By: {created_by}
+   Assigned To: {assigned_to}
+   Tags: {tags}
+"""
 
 @click.group()
 @click.option('--verbose', is_flag=True, help='Enable debug logging')
@@ -21,6 +29,7 @@ def cli(verbose):
 @click.argument("password")
 def register(username, email, password):
     """Register a new user"""
+    from database import db
     if len(password) < 8:
         click.echo("❌ Password must be at least 8 characters")
         return
@@ -35,6 +44,7 @@ def register(username, email, password):
 @click.argument("password")
 def login(username, password):
     """Authenticate a user"""
+    from database import db
     if db.authenticate_user(username, password):
         click.echo(f"✅ Authenticated as {username}")
     else:
@@ -53,6 +63,7 @@ def login(username, password):
 @click.option("--assign-to", help="Assignee username")
 def add(title, description, due_date, priority, tag, recurrence, created_by, assign_to):
     """Add a new task"""
+    from database import db
     try:
         if due_date:
             datetime.strptime(due_date, "%Y-%m-%d")
@@ -88,34 +99,38 @@ def add(title, description, due_date, priority, tag, recurrence, created_by, ass
 @click.option("--reverse", is_flag=True, help="Reverse sort order")
 def list_tasks(username, priority, status, overdue, search, tag, sort, reverse):
     """List tasks with filters"""
+    from database import db
+    now_iso = datetime.now().isoformat()
     filters = {
         "username": username,
         "priority": priority,
         "status": status,
         "search": search,
-        "tags": list(tag)
+        "tags": list(tag),
+        "overdue_before": now_iso if overdue else None
     }
     
     tasks = db.get_tasks(filters, sort, reverse)
     
-    if overdue:
-        now = datetime.now().isoformat()
-        tasks = [t for t in tasks if t.get("due_date") and t["due_date"] < now and t["status"] != "completed"]
-    
     if not tasks:
         click.echo("No tasks found")
         return
         
-    for task in tasks:
-        due_date = datetime.fromisoformat(task["due_date"]).strftime("%Y-%m-%d") if task.get("due_date") else "None"
-        click.echo(f"""
-📌 {task['title']} [ID: {task['id']}]
-   Status: {task['status'].capitalize()}
-   Priority: {task['priority'].capitalize()}
-   Due: {due_date}
-   Created By: {task['created_by']}
-   Assigned To: {task.get('assigned_to', 'Unassigned')}
-   Tags: {', '.join(task['tags'].split(',')) if task.get('tags') else 'None'}""")
+    # Render every task first so the whole listing goes out in one write
+    click.echo("".join(
+        TASK_TEMPLATE.format(
+            title=task['title'],
+            id=task['id'],
+            status=task['status'].capitalize(),
+            priority=task['priority'].capitalize(),
+            # ISO-8601 strings already start with YYYY-MM-DD
+            due_date=task['due_date'][:10] if task['due_date'] else "None",
+            created_by=task['created_by'],
+            assigned_to=task['assigned_to'] or 'Unassigned',
+            tags=', '.join(task['tags'].split(',')) if task['tags'] else 'None'
+        )
+        for task in tasks
+    ), nl=False)
 
 @cli.command()
 @click.argument("task_id")
@@ -126,6 +141,7 @@ def list_tasks(username, priority, status, overdue, search, tag, sort, reverse):
 @click.option("--description", help="New description")
 def update(task_id, status, due_date, priority, tag, description):
     """Update an existing task"""
+    from database import db
     if not task_id or len(task_id) != 36:
         click.echo("❌ Invalid task ID format")
         return
@@ -156,6 +172,7 @@ def update(task_id, status, due_date, priority, tag, description):
 @click.argument("task_id")
 def delete(task_id):
     """Delete a task permanently"""
+    from database import db
     if not task_id or len(task_id) != 36:
         click.echo("❌ Invalid task ID format")
         return
@@ -172,6 +189,7 @@ def delete(task_id):
 @click.argument("assignee")
 def assign(task_id, assigner, assignee):
     """Assign task to another user"""
+    from database import db
     if not task_id or len(task_id) != 36:
         click.echo("❌ Invalid task ID format")
         return
@@ -185,21 +203,16 @@ def assign(task_id, assigner, assignee):
 @click.argument("username")
 def workload(username):
     """Show user's task workload"""
-    tasks = db.get_user_tasks(username)
-    
-    status_counts = {"pending": 0, "completed": 0}
-    priority_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-    
-    for task in tasks:
-        status_counts[task["status"]] += 1
-        priority_counts[task["priority"]] += 1
+    from database import db
+    counts = db.get_user_counts(username, datetime.now().isoformat())
+    status_counts = counts["status"]
     
     click.echo(f"\n📊 Workload Report for {username}")
     click.echo("--------------------------------")
-    click.echo(f"Total Tasks: {len(tasks)}")
+    click.echo(f"Total Tasks: {counts['total']}")
     click.echo(f"Pending: {status_counts['pending']} | Completed: {status_counts['completed']}")
     click.echo("\nPriority Breakdown:")
-    for prio, count in priority_counts.items():
+    for prio, count in counts["priority"].items():
         click.echo(f"  {prio.capitalize()}: {count}")
 
 # ----- Reporting Commands -----
@@ -225,12 +238,12 @@ def report(username, output):
    Medium: {stats['priority_distribution']['medium']}
    Low: {stats['priority_distribution']['low']}
 """)
-        if generate_productivity_chart(username, output):
+        if generate_productivity_chart(username, output, stats):
             click.echo(f"📊 Visualization saved to {output}")
         else:
             click.echo("❌ Failed to generate chart")
     except ImportError as e:
-        click.echo(f"❌ Missing dependencies: {str(e)}\nRun: pip install matplotlib pandas")
+        click.echo(f"❌ Missing dependencies: {str(e)}\nRun: pip install matplotlib")
     except Exception as e:
         click.echo(f"❌ Report generation failed: {str(e)}")
 
@@ -242,8 +255,6 @@ def export(filename):
         from utils.reports import export_to_csv
         export_to_csv(filename)
         click.echo(f"✅ Tasks exported to {filename}")
-    except ImportError:
-        click.echo("❌ Error: pandas package not installed. Run: pip install pandas")
     except Exception as e:
         click.echo(f"❌ Export failed: {str(e)}")
 
@@ -259,6 +270,7 @@ def process_recurring():
 @click.argument("backup_file", type=click.Path())
 def backup(backup_file):
     """Create database backup"""
+    from database import db
     try:
         db.backup(backup_file)
         click.echo(f"✅ Backup created at {backup_file}")
@@ -269,6 +281,7 @@ def backup(backup_file):
 @click.argument("backup_file", type=click.Path(exists=True))
 def restore(backup_file):
     """Restore from backup"""
+    from database import db
     try:
         db.restore(backup_file)
         click.echo(f"✅ Restored from {backup_file}")
@@ -283,6 +296,7 @@ def restore(backup_file):
 @click.option("--notifications/--no-notifications", default=True, help="Enable notifications")
 def settings(username, theme, date_format, notifications):
     """Configure user preferences"""
+    from database import db
     prefs = {
         "theme": theme,
         "date_format": date_format,
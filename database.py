@@ -1,24 +1,112 @@
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional
-import bcrypt
+from typing import Dict, List, Optional, Sequence, Tuple
 import logging
 from uuid import uuid4
-import shutil
 import os
+from pathlib import Path
 import json
+import threading
+import hashlib
+import time
+from contextlib import closing, contextmanager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_BCRYPT_ROUNDS = 12
+
+def _bcrypt_rounds() -> int:
+    """Read the bcrypt work factor from BCRYPT_ROUNDS, falling back to the default"""
+    value = os.environ.get("BCRYPT_ROUNDS")
+    if value is None:
+        return DEFAULT_BCRYPT_ROUNDS
+    try:
+        rounds = int(value)
+    except ValueError:
+        rounds = 0
+    if not 4 <= rounds <= 31:
+        logger.warning(
+            f"Invalid BCRYPT_ROUNDS {value!r} (expected 4-31), using {DEFAULT_BCRYPT_ROUNDS}"
+        )
+        return DEFAULT_BCRYPT_ROUNDS
+    return rounds
+
+BCRYPT_ROUNDS = _bcrypt_rounds()
+AUTH_CACHE_TTL = 60
+AUTH_NEG_CACHE_TTL = 30
+AUTH_CACHE_SIZE = 128
+
+TASK_COLUMNS = (
+    "id", "title", "description", "due_date", "priority", "status",
+    "tags", "recurrence", "created_at", "created_by", "assigned_to"
+)
+SORT_COLUMNS = {"due_date", "priority", "created_at"}
+
+def _split_tags(tags) -> List[str]:
+    """Normalize a tag list or comma-joined tags string into unique tags"""
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        tags = tags.split(",")
+    return list(dict.fromkeys(tag.strip() for tag in tags if tag.strip()))
+
+def _fts_phrase(term: str) -> str:
+    """Quote a term as an FTS5 phrase so user input is never parsed as syntax"""
+    return '"' + term.replace('"', '""') + '"'
+
 class DatabaseManager:
     def __init__(self, db_path: str = "tasks.db"):
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._auth_cache: Dict[Tuple[str, bytes], float] = {}
+        self._auth_neg_cache: Dict[Tuple[str, bytes], float] = {}
+        self._settings_cache: Dict[str, Dict] = {}
+        self._settings_lock = threading.Lock()
+        self._stmt_cache: Dict[tuple, str] = {}
+        self._conn = self._connect()
+        self._local = threading.local()
         self._initialize_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived connection and apply tuning PRAGMAs"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get this thread's read connection"""
+        # Reads stay off the shared write connection so they never see
+        # another thread's uncommitted transaction
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Run a block of writes in a single IMMEDIATE transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                # Also reached when COMMIT itself fails (e.g. SQLITE_BUSY),
+                # which would otherwise leave the shared connection mid-transaction
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
     def _initialize_database(self):
         """Initialize database schema safely"""
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             # Users Table
@@ -56,29 +144,126 @@ class DatabaseManager:
                 CREATE INDEX IF NOT EXISTS idx_tasks_priority 
                 ON tasks(priority)
             """)
-            conn.commit()
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_recurring
+                ON tasks(due_date) WHERE recurrence IS NOT NULL
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_created_by
+                ON tasks(created_by, status, due_date)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to
+                ON tasks(assigned_to, status, due_date)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_due_date
+                ON tasks(due_date) WHERE status = 'pending'
+            """)
+
+            # Normalized task tags
+            tags_exist = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'task_tags'"
+            ).fetchone()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS task_tags (
+                    task_id TEXT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (tag, task_id)
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_task_tags_task_id
+                ON task_tags(task_id)
+            """)
+            if not tags_exist:
+                # One-time migration from comma-joined tags strings
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO task_tags (task_id, tag) VALUES (?, ?)",
+                    [
+                        (row[0], tag)
+                        for row in cursor.execute(
+                            "SELECT id, tags FROM tasks WHERE tags != ''"
+                        ).fetchall()
+                        for tag in _split_tags(row[1])
+                    ]
+                )
+
+            # Full-text index over title and description (tags live in task_tags).
+            # It is keyed on the implicit rowid of tasks (whose primary key is
+            # TEXT), which VACUUM may renumber: any VACUUM must be followed by
+            # INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild').
+            fts_sql = cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'tasks_fts'"
+            ).fetchone()
+            if fts_sql and "tags" in fts_sql[0]:
+                # Drop the earlier layout that also indexed tags
+                for trigger in ("tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                cursor.execute("DROP TABLE tasks_fts")
+                fts_sql = None
+            fts_exists = fts_sql is not None
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+                    title, description,
+                    content='tasks', content_rowid='rowid'
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+                    INSERT INTO tasks_fts(rowid, title, description)
+                    VALUES (new.rowid, new.title, new.description);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+                    INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+                    VALUES ('delete', old.rowid, old.title, old.description);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_update
+                AFTER UPDATE OF title, description ON tasks BEGIN
+                    INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+                    VALUES ('delete', old.rowid, old.title, old.description);
+                    INSERT INTO tasks_fts(rowid, title, description)
+                    VALUES (new.rowid, new.title, new.description);
+                END
+            """)
+            if not fts_exists:
+                cursor.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+            # Planner statistics: re-analyze (bounded by analysis_limit) when
+            # the tasks stats are missing or the table has since halved/doubled
+            analyzed_rows = 0
+            if cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone():
+                # The first stat field is the (estimated) row count per index
+                analyzed_rows = cursor.execute(
+                    "SELECT MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 WHERE tbl = 'tasks'"
+                ).fetchone()[0] or 0
+            current_rows = cursor.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            if current_rows and not analyzed_rows / 2 <= current_rows <= analyzed_rows * 2:
+                cursor.execute("PRAGMA analysis_limit = 1000")
+                cursor.execute("ANALYZE")
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get configured database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the shared database connection"""
+        return self._conn
 
     # User Management
     def create_user(self, username: str, email: str, password: str) -> bool:
         """Create a new user account"""
+        import bcrypt
+        # Hash before taking the write lock; bcrypt is deliberately slow
+        hashed_password = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
         try:
-            with self._get_connection() as conn:
+            with self._transaction() as conn:
                 conn.execute("""
                     INSERT INTO users (username, email, hashed_password)
                     VALUES (?, ?, ?)
-                """, (
-                    username,
-                    email,
-                    bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
-                ))
-                conn.commit()
+                """, (username, email, hashed_password))
                 return True
         except sqlite3.IntegrityError as e:
             logger.error(f"User creation failed: {str(e)}")
@@ -86,134 +271,275 @@ class DatabaseManager:
 
     def authenticate_user(self, username: str, password: str) -> bool:
         """Verify user credentials"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT hashed_password FROM users WHERE username = ?
-            """, (username,))
-            result = cursor.fetchone()
-            if not result:
-                return False
-            return bcrypt.checkpw(password.encode(), result[0].encode())
+        key = (username, hashlib.blake2b(password.encode(), digest_size=16).digest())
+        now = time.monotonic()
+        if self._auth_neg_cache.get(key, 0) > now:
+            return False
+        if self._auth_cache.get(key, 0) > now:
+            return True
+
+        result = self._reader().execute("""
+            SELECT hashed_password FROM users WHERE username = ?
+        """, (username,)).fetchone()
+        if not result:
+            return False
+        import bcrypt
+        authenticated = bcrypt.checkpw(password.encode(), result[0].encode())
+
+        if authenticated:
+            self._remember_auth(self._auth_cache, key, AUTH_CACHE_TTL)
+        else:
+            self._remember_auth(self._auth_neg_cache, key, AUTH_NEG_CACHE_TTL)
+        return authenticated
+
+    @staticmethod
+    def _remember_auth(cache: Dict[Tuple[str, bytes], float], key: Tuple[str, bytes], ttl: int) -> None:
+        """Store an authentication result expiry, evicting the oldest entry when full"""
+        cache.pop(key, None)
+        if len(cache) >= AUTH_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = time.monotonic() + ttl
 
     # Task Management
     def create_task(self, task_data: Dict) -> Optional[str]:
         """Create a new task"""
-        if not task_data.get("title") or not task_data.get("created_by"):
+        task_ids = self.create_tasks([task_data])
+        return task_ids[0] if task_ids else None
+
+    def create_tasks(self, tasks_data: List[Dict]) -> Optional[List[str]]:
+        """Create several tasks in a single transaction"""
+        if any(not t.get("title") or not t.get("created_by") for t in tasks_data):
             logger.error("Missing required fields: title and created_by")
             return None
 
-        task_id = str(uuid4())
+        rows = []
+        task_tags = []
+        for task_data in tasks_data:
+            task_id = str(uuid4())
+            tags = _split_tags(task_data.get("tags"))
+            rows.append((
+                task_id,
+                task_data["title"],
+                task_data.get("description", ""),
+                task_data.get("due_date"),
+                task_data.get("priority", "medium"),
+                task_data.get("status", "pending"),
+                ",".join(tags),
+                task_data.get("recurrence"),
+                task_data["created_by"],
+                task_data.get("assigned_to")
+            ))
+            task_tags.append((task_id, tags))
         try:
-            with self._get_connection() as conn:
-                conn.execute("""
+            with self._transaction() as conn:
+                conn.executemany("""
                     INSERT INTO tasks (
                         id, title, description, due_date, priority, status, 
                         tags, recurrence, created_by, assigned_to
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    task_id,
-                    task_data["title"],
-                    task_data.get("description", ""),
-                    task_data.get("due_date"),
-                    task_data.get("priority", "medium"),
-                    task_data.get("status", "pending"),
-                    ",".join(task_data["tags"]) if isinstance(task_data.get("tags"), list) else task_data.get("tags", ""),
-                    task_data.get("recurrence"),
-                    task_data["created_by"],
-                    task_data.get("assigned_to")
-                ))
-                conn.commit()
-                return task_id
+                """, rows)
+                self._set_task_tags(conn, task_tags)
+                return [row[0] for row in rows]
         except sqlite3.Error as e:
             logger.error(f"Task creation failed: {str(e)}")
             return None
 
-    def get_tasks(self, filters: Dict = None, sort: str = "due_date", reverse: bool = False) -> List[Dict]:
+    def get_tasks(self, filters: Dict = None, sort: str = "due_date", reverse: bool = False,
+                  columns: Sequence[str] = TASK_COLUMNS) -> List[sqlite3.Row]:
         """Get tasks with advanced filtering and sorting"""
-        query = "SELECT * FROM tasks WHERE 1=1"
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Invalid sort column: {sort}")
+        columns = tuple(columns)
+        if not set(columns) <= set(TASK_COLUMNS):
+            raise ValueError(f"Invalid columns: {', '.join(columns)}")
+
+        filters = filters or {}
+        search_terms = (filters.get("search") or "").split()
+        tags = _split_tags(filters.get("tags"))
         params = []
+        if filters.get("username"):
+            params.extend([filters["username"]] * 2)
+        if search_terms:
+            params.append(
+                "{title description} : (" + " ".join(_fts_phrase(t) + "*" for t in search_terms) + ")"
+            )
+        params.extend(tags)
+        if filters.get("priority"):
+            params.append(filters["priority"])
+        if filters.get("status"):
+            params.append(filters["status"])
+        if filters.get("overdue_before"):
+            params.append(filters["overdue_before"])
+
+        key = (
+            bool(filters.get("username")),
+            bool(search_terms),
+            len(tags),
+            bool(filters.get("priority")),
+            bool(filters.get("status")),
+            bool(filters.get("overdue_before")),
+            bool(filters.get("recurrence")),
+            columns,
+            sort,
+            reverse
+        )
+        query = self._stmt_cache.get(key)
+        if query is None:
+            query = self._stmt_cache[key] = self._build_tasks_query(*key)
         
-        if filters:
-            if filters.get("username"):
-                query += " AND (created_by = ? OR assigned_to = ?)"
-                params.extend([filters["username"]] * 2)
-            if filters.get("search"):
-                query += " AND (title LIKE ? OR description LIKE ?)"
-                params.extend([f"%{filters['search']}%"] * 2)
-            if filters.get("tags"):
-                query += " AND (" + " OR ".join(["tags LIKE ?" for _ in filters["tags"]]) + ")"
-                params.extend([f"%{tag}%" for tag in filters["tags"]])
-            if filters.get("priority"):
-                query += " AND priority = ?"
-                params.append(filters["priority"])
-            if filters.get("status"):
-                query += " AND status = ?"
-                params.append(filters["status"])
+        return self._reader().execute(query, params).fetchall()
+
+    @staticmethod
+    def _build_tasks_query(has_username: bool, has_search: bool, n_tags: int,
+                           has_priority: bool, has_status: bool, has_overdue: bool,
+                           has_recurrence: bool, columns: Tuple[str, ...],
+                           sort: str, reverse: bool) -> str:
+        """Build the parameterized get_tasks query for a filter combination"""
+        query = f"SELECT {', '.join(columns)} FROM tasks WHERE 1=1"
+        if has_username:
+            query += " AND (created_by = ? OR assigned_to = ?)"
+        if has_search:
+            query += " AND rowid IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)"
+        if n_tags:
+            query += (" AND id IN (SELECT task_id FROM task_tags WHERE tag IN ("
+                      + ", ".join(["?"] * n_tags) + "))")
+        if has_priority:
+            query += " AND priority = ?"
+        if has_status:
+            query += " AND status = ?"
+        if has_overdue:
+            query += " AND due_date < ? AND status = 'pending'"
+        if has_recurrence:
+            query += " AND recurrence IS NOT NULL"
         
         # Sorting
         sort_order = "DESC" if reverse else "ASC"
-        query += f" ORDER BY {sort} {sort_order}"
-        
-        with self._get_connection() as conn:
-            return [dict(row) for row in conn.execute(query, params).fetchall()]
+        return query + f" ORDER BY {sort} {sort_order}"
+
+    def iter_tasks(self) -> sqlite3.Cursor:
+        """Stream every task row without materializing the result set"""
+        return self._reader().execute(f"SELECT {', '.join(TASK_COLUMNS)} FROM tasks")
 
     def update_task(self, task_id: str, updates: dict) -> bool:
         """Update an existing task"""
+        return self.update_tasks([(task_id, updates)])
+
+    def update_tasks(self, task_updates: List[Tuple[str, Dict]]) -> bool:
+        """Apply (task_id, updates) pairs in a single transaction"""
+        groups: Dict[Tuple[str, ...], List[list]] = {}
+        task_tags = []
+        for task_id, updates in task_updates:
+            updates = dict(updates)
+            if "tags" in updates:
+                tags = _split_tags(updates["tags"])
+                updates["tags"] = ",".join(tags)
+                task_tags.append((task_id, tags))
+            groups.setdefault(tuple(updates), []).append(list(updates.values()) + [task_id])
         try:
-            with self._get_connection() as conn:
-                set_clause = ", ".join([f"{k} = ?" for k in updates])
-                values = list(updates.values()) + [task_id]
-                conn.execute(f"""
-                    UPDATE tasks 
-                    SET {set_clause}
-                    WHERE id = ?
-                """, values)
-                conn.commit()
+            with self._transaction() as conn:
+                for keys, values in groups.items():
+                    set_clause = ", ".join([f"{k} = ?" for k in keys])
+                    conn.executemany(f"""
+                        UPDATE tasks 
+                        SET {set_clause}
+                        WHERE id = ?
+                    """, values)
+                self._set_task_tags(conn, task_tags)
                 return True
         except sqlite3.Error as e:
             logger.error(f"Update failed: {str(e)}")
             return False
 
+    @staticmethod
+    def _set_task_tags(conn: sqlite3.Connection, task_tags: List[Tuple[str, List[str]]]) -> None:
+        """Replace task_tags rows from (task_id, tags) pairs"""
+        conn.executemany(
+            "DELETE FROM task_tags WHERE task_id = ?",
+            [(task_id,) for task_id, _ in task_tags]
+        )
+        conn.executemany(
+            "INSERT INTO task_tags (task_id, tag) VALUES (?, ?)",
+            [(task_id, tag) for task_id, tags in task_tags for tag in tags]
+        )
+
+    def get_due_recurring_tasks(self, before: str) -> List[sqlite3.Row]:
+        """Get recurring tasks due on or before the given ISO timestamp"""
+        return self._reader().execute("""
+            SELECT id, due_date, recurrence FROM tasks
+            WHERE recurrence IS NOT NULL AND due_date <= ?
+        """, (before,)).fetchall()
+
     def delete_task(self, task_id: str) -> bool:
         """Delete a task permanently"""
         try:
-            with self._get_connection() as conn:
+            with self._transaction() as conn:
                 conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-                conn.commit()
                 return True
         except sqlite3.Error as e:
             logger.error(f"Deletion failed: {str(e)}")
             return False
 
     # User-specific methods
-    def get_user_tasks(self, username: str) -> List[Dict]:
+    def get_user_tasks(self, username: str) -> List[sqlite3.Row]:
         """Get all tasks visible to a user"""
         return self.get_tasks({"username": username})
 
+    def get_user_counts(self, username: str, now: str) -> Dict:
+        """Get status, priority and overdue counts for a user's tasks"""
+        total, completed, overdue, by_priority = self._reader().execute("""
+            SELECT COALESCE(SUM(cnt), 0), COALESCE(SUM(completed), 0),
+                   COALESCE(SUM(overdue), 0), json_group_object(priority, cnt)
+            FROM (
+                SELECT priority, COUNT(*) AS cnt,
+                       SUM(status = 'completed') AS completed,
+                       SUM(status = 'pending' AND due_date < ?) AS overdue
+                FROM tasks
+                WHERE created_by = ? OR assigned_to = ?
+                GROUP BY priority
+            )
+        """, (now, username, username)).fetchone()
+        priority = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        priority.update(json.loads(by_priority))
+        return {
+            "total": total,
+            "overdue": overdue,
+            "status": {"pending": total - completed, "completed": completed},
+            "priority": priority
+        }
+
     def get_user_settings(self, username: str) -> Dict:
         """Get user settings"""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT settings FROM users WHERE username = ?", (username,))
-            result = cursor.fetchone()
-            if result and result[0]:
-                try:
-                    return json.loads(result[0])
-                except json.JSONDecodeError:
-                    return {}
-            return {}
+        with self._settings_lock:
+            if username in self._settings_cache:
+                return dict(self._settings_cache[username])
+
+        settings = {}
+        result = self._reader().execute(
+            "SELECT settings FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        if result and result[0]:
+            try:
+                settings = json.loads(result[0])
+            except json.JSONDecodeError:
+                pass
+        with self._settings_lock:
+            self._settings_cache.setdefault(username, settings)
+        return dict(settings)
 
     def save_settings(self, username: str, settings: Dict) -> bool:
         """Save user preferences"""
         try:
-            with self._get_connection() as conn:
-                conn.execute("""
+            with self._transaction() as conn:
+                result = conn.execute("""
                     UPDATE users SET settings = ?
                     WHERE username = ?
                 """, (json.dumps(settings), username))
-                conn.commit()
-                return True
+            with self._settings_lock:
+                if result.rowcount > 0:
+                    self._settings_cache[username] = dict(settings)
+                else:
+                    self._settings_cache.pop(username, None)
+            return True
         except sqlite3.Error as e:
             logger.error(f"Settings save failed: {str(e)}")
             return False
@@ -222,7 +548,7 @@ class DatabaseManager:
     def assign_task(self, task_id: str, assigner: str, assignee: str) -> bool:
         """Assign task to another user"""
         try:
-            with self._get_connection() as conn:
+            with self._transaction() as conn:
                 # Verify assignee exists
                 if not conn.execute("SELECT 1 FROM users WHERE username = ?", (assignee,)).fetchone():
                     return False
@@ -232,7 +558,6 @@ class DatabaseManager:
                     "UPDATE tasks SET assigned_to = ? WHERE id = ? AND created_by = ?",
                     (assignee, task_id, assigner)
                 )
-                conn.commit()
                 return result.rowcount > 0
         except sqlite3.Error as e:
             logger.error(f"Assignment failed: {str(e)}")
@@ -242,7 +567,11 @@ class DatabaseManager:
     def backup(self, backup_path: str) -> bool:
         """Create database backup"""
         try:
-            shutil.copy2(self.db_path, backup_path)
+            with closing(sqlite3.connect(backup_path)) as dst, self._lock:
+                self._conn.backup(dst, pages=1024)
+                # Keep backups as plain rollback-journal files, so opening one
+                # read-only for restore needs no -wal/-shm files beside it
+                dst.execute("PRAGMA journal_mode = DELETE")
             return True
         except Exception as e:
             logger.error(f"Backup failed: {str(e)}")
@@ -251,9 +580,14 @@ class DatabaseManager:
     def restore(self, backup_path: str) -> bool:
         """Restore database from backup"""
         try:
-            if os.path.exists(self.db_path):
-                os.remove(self.db_path)
-            shutil.copy2(backup_path, self.db_path)
+            source_uri = Path(backup_path).resolve().as_uri() + "?mode=ro"
+            with closing(sqlite3.connect(source_uri, uri=True)) as src, self._lock:
+                src.backup(self._conn, pages=1024)
+                self._initialize_database()
+                self._auth_cache.clear()
+                self._auth_neg_cache.clear()
+                with self._settings_lock:
+                    self._settings_cache.clear()
             return True
         except Exception as e:
             logger.error(f"Restore failed: {str(e)}")
@@ -1,8 +1,11 @@
+import calendar
 from datetime import datetime, timedelta
 from database import db
-import schedule
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 def calculate_next_occurrence(due_date: datetime, recurrence: str) -> datetime:
     """Calculate next occurrence date for recurring tasks"""
     if recurrence == "daily":
@@ -10,24 +13,36 @@ def calculate_next_occurrence(due_date: datetime, recurrence: str) -> datetime:
     elif recurrence == "weekly":
         return due_date + timedelta(weeks=1)
     elif recurrence == "monthly":
-        return (due_date.replace(day=1) + timedelta(days=32)).replace(day=due_date.day)
+        next_month = due_date.replace(day=1) + timedelta(days=32)
+        # Clamp to the target month's length (e.g. Jan 31 -> Feb 28)
+        last_day = calendar.monthrange(next_month.year, next_month.month)[1]
+        return next_month.replace(day=min(due_date.day, last_day))
     return due_date
 
 def check_and_update_recurring_tasks():
     """Process all recurring tasks"""
-    for task in db.get_tasks({"recurrence": True}):
-        if task['due_date'] and datetime.fromisoformat(task['due_date']) <= datetime.now():
-            updated_task = task.copy()
-            updated_task['due_date'] = calculate_next_occurrence(
+    updates = []
+    for task in db.get_due_recurring_tasks(datetime.now().isoformat()):
+        try:
+            next_due = calculate_next_occurrence(
                 datetime.fromisoformat(task['due_date']),
                 task['recurrence']
-            ).isoformat()
-            db.update_task(task['id'], updated_task)
+            )
+        except (ValueError, TypeError) as e:
+            # Malformed stored due_date
+            logger.error(f"Skipping recurring task {task['id']}: {str(e)}")
+            continue
+        updates.append((task['id'], {'due_date': next_due.isoformat()}))
+    if updates:
+        db.update_tasks(updates)
 
 def start_reminder_daemon(interval_minutes: int = 5):
     """Run reminders in background"""
-    schedule.every(interval_minutes).minutes.do(check_and_update_recurring_tasks)
+    interval = interval_minutes * 60
+    next_run = time.monotonic() + interval
     
     while True:
-        schedule.run_pending()
-        time.sleep(1)
\ No newline at end of file
+        time.sleep(max(0, next_run - time.monotonic()))
+        check_and_update_recurring_tasks()
+        # Skip missed ticks rather than running them back to back
+        next_run = max(next_run + interval, time.monotonic())
\ No newline at end of file
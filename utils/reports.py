@@ -1,9 +1,10 @@
-import sqlite3
-import pandas as pd
+import csv
+from contextlib import closing
+from database import db
 
 def export_to_csv(filename: str = "tasks_export.csv") -> None:
     """Export all tasks to CSV"""
-    conn = sqlite3.connect("tasks.db")
-    df = pd.read_sql_query("SELECT * FROM tasks", conn)
-    df.to_csv(filename, index=False)
-    conn.close()
\ No newline at end of file
+    with closing(db.iter_tasks()) as cursor, open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(column[0] for column in cursor.description)
+        writer.writerows(cursor)
\ No newline at end of file
@@ -1,7 +1,22 @@
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from database import db
 
-def generate_productivity_chart(username: str, filename: str = "productivity.png"):
+# One figure per theme: style-derived colors are fixed when a figure is
+# built, so a figure created under one theme cannot be reused for another
+_figures = {}
+
+def _get_axes(theme: str):
+    """Return the theme's cached figure and its cleared axes"""
+    if theme not in _figures:
+        _figures[theme], _ = plt.subplots(figsize=(10, 5))
+    fig = _figures[theme]
+    ax = fig.axes[0]
+    ax.cla()
+    return fig, ax
+
+def generate_productivity_chart(username: str, filename: str = "productivity.png", stats: dict = None):
     """Generate visual report with theme support"""
     try:
         # Get user settings
@@ -20,9 +35,10 @@ def generate_productivity_chart(username: str, filename: str = "productivity.png
             }
         }.get(theme, "light")
         
-        # Get stats
-        from utils.stats import get_user_productivity
-        stats = get_user_productivity(username)
+        # Get stats unless the caller already computed them
+        if stats is None:
+            from utils.stats import get_user_productivity
+            stats = get_user_productivity(username)
         
         # Prepare data
         categories = ["Completed", "Pending", "Overdue"]
@@ -34,7 +50,7 @@ def generate_productivity_chart(username: str, filename: str = "productivity.png
         
         # Create figure
         plt.style.use("dark_background" if theme == "dark" else "default")
-        fig, ax = plt.subplots(figsize=(10, 5))
+        fig, ax = _get_axes(theme)
         fig.patch.set_facecolor(colors["bg"])
         
         # Create chart
@@ -50,9 +66,8 @@ def generate_productivity_chart(username: str, filename: str = "productivity.png
                     f'{int(height)}',
                     ha='center', va='bottom', color=colors["text"])
         
-        plt.tight_layout()
-        plt.savefig(filename, facecolor=colors["bg"])
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(filename, facecolor=colors["bg"])
         return True
     except Exception as e:
         print(f"❌ Visualization error: {str(e)}")